@@ -0,0 +1,113 @@
+from collections import Counter
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+import Ultimate_Texas_Holdem as uth
+
+
+# Every 5-card hand per category, with royal flushes split out of straight flushes as pay class 9
+FIVE_CARD_CLASS_COUNTS = [1302540, 1098240, 123552, 54912, 10200, 5108, 3744, 624, 36, 4]
+
+
+def reference_key(cards):
+    # Independent 5-card ranking: (category, tiebreak ranks), compared as tuples
+    ranks = sorted((card >> 2 for card in cards), reverse=True)
+    counts = Counter(ranks)
+    groups = sorted(counts.items(), key=lambda item: (item[1], item[0]), reverse=True)
+    ordered = [rank for rank, _ in groups]
+    flush = len({card & 3 for card in cards}) == 1
+
+    straight_top = None
+    if len(counts) == 5:
+        if ranks[0] - ranks[4] == 4:
+            straight_top = ranks[0]
+        elif ranks == [12, 3, 2, 1, 0]:
+            straight_top = 3
+
+    if straight_top is not None and flush:
+        return (8, straight_top)
+    if groups[0][1] == 4:
+        return (7, *ordered)
+    if groups[0][1] == 3 and groups[1][1] == 2:
+        return (6, *ordered)
+    if flush:
+        return (5, *ranks)
+    if straight_top is not None:
+        return (4, straight_top)
+    if groups[0][1] == 3:
+        return (3, *ordered)
+    if groups[0][1] == 2 and groups[1][1] == 2:
+        return (2, *ordered)
+    if groups[0][1] == 2:
+        return (1, *ordered)
+    return (0, *ranks)
+
+
+def best_of_subsets(cards):
+    return max(uth.evaluate5(five) for five in combinations(cards, 5))
+
+
+@pytest.fixture(scope='module')
+def rng():
+    return np.random.default_rng(20240501)
+
+
+def test_every_five_card_hand_by_class():
+    hands = np.array(list(combinations(range(52), 5)), dtype=np.uint8)
+    classes = uth.pay_classes(uth.evaluate_batch(hands))
+    assert np.bincount(classes, minlength=10).tolist() == FIVE_CARD_CLASS_COUNTS
+
+
+def test_evaluate5_orders_like_reference(rng):
+    hands = [tuple(deal) for deal in uth.Deck.deal_batch(20000, 5, rng).tolist()]
+    ordered = sorted(hands, key=reference_key)
+    for lower, higher in zip(ordered, ordered[1:]):
+        lower_strength, higher_strength = uth.evaluate5(lower), uth.evaluate5(higher)
+        if reference_key(lower) == reference_key(higher):
+            assert lower_strength == higher_strength
+        else:
+            assert lower_strength < higher_strength
+
+
+def test_evaluate5_categories_match_reference(rng):
+    for hand in uth.Deck.deal_batch(5000, 5, rng).tolist():
+        assert uth.hand_category(uth.evaluate5(hand)) == reference_key(hand)[0]
+
+
+@pytest.mark.parametrize('size', [5, 6, 7])
+def test_evaluate_cards_is_best_five(rng, size):
+    for cards in uth.Deck.deal_batch(3000, size, rng).tolist():
+        assert uth.evaluate_cards(cards) == best_of_subsets(cards)
+
+
+@pytest.mark.parametrize('size', [5, 6, 7])
+def test_evaluate_batch_matches_evaluate_cards(rng, size):
+    hands = uth.Deck.deal_batch(20000, size, rng)
+    expected = [uth.evaluate_cards(cards) for cards in hands.tolist()]
+    assert uth.evaluate_batch(hands).tolist() == expected
+
+
+def test_evaluate_batch_flush_rows():
+    # Seven cards with a flush and a bigger pair combination elsewhere: the flush must win
+    hands = np.array([[0, 4, 8, 12, 24, 1, 5], [48, 44, 40, 36, 32, 49, 45]], dtype=np.uint8)
+    assert uth.evaluate_batch(hands).tolist() == [uth.evaluate_cards(cards) for cards in hands.tolist()]
+    assert uth.hand_category(int(uth.evaluate_batch(hands)[0])) == 5
+    assert uth.pay_classes(uth.evaluate_batch(hands))[1] == 9
+
+
+def test_known_hands():
+    royal = uth.evaluate_cards([uth.create_card(card) for card in ['As', 'Ks', 'Qs', 'Js', 'Ts', '2d', '3c']])
+    wheel = uth.evaluate_cards([uth.create_card(card) for card in ['Ah', '2d', '3c', '4s', '5h']])
+    six_high = uth.evaluate_cards([uth.create_card(card) for card in ['6h', '2d', '3c', '4s', '5h']])
+    assert royal == uth.ROYAL_FLUSH_STRENGTH
+    assert uth.hand_category(wheel) == uth.hand_category(six_high) == 4
+    assert wheel < six_high
+
+
+def test_evaluate_batch_rejects_bad_input():
+    with pytest.raises(ValueError):
+        uth.evaluate_batch(np.zeros((3, 4), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        uth.evaluate_batch(np.array([[0, 1, 2, 3, 52]]))